@@ -1,12 +1,20 @@
+import functools
 import inspect
 import os
+import sys
+import types
+import warnings
 from abc import abstractmethod
-from typing import Any, Dict, Tuple, Optional, Type
+from typing import Any, Dict, Tuple, Optional, Type, Set, Callable
 from unittest import TestCase
 
 from ._AbstractTestMeta import AbstractTestMeta
-from .serialisation import BytesSerialiser, StringSerialiser, RegressionSerialiser
-from ._functions import get_subject_args, get_skip_reason, get_serialisers, is_test
+from ._OrphanedRegressionWarning import OrphanedRegressionWarning
+from ._baselines import is_updating_baselines, record_baseline_update, \
+    BASELINE_NEW, BASELINE_CHANGED, BASELINE_UNCHANGED
+from .serialisation import BytesSerialiser, StringSerialiser, RegressionSerialiser, RegressionManifest
+from ._functions import get_subject_args, get_skip_reason, get_serialisers, is_test, is_regression_test, \
+    is_self_timed
 
 # The default location to store regression test results
 DEFAULT_REGRESSION_ROOT = os.path.join(".", "resources", "regression")
@@ -24,6 +32,25 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
 
         super().__init__(methodName)
 
+        # The name of the alternative subject currently being tested,
+        # or None for the main subject
+        self._alternative: Optional[str] = None
+
+        # The regression results of the main subject, which the
+        # alternative subjects' results are checked against
+        self._primary_results: Dict[str, Any] = {}
+
+        # Whether the test is being re-run only to time the current
+        # subject, so its results have already been checked
+        self._timing: bool = False
+
+        # The time the current subject has spent executing the test body
+        self._subject_time: float = 0.0
+
+        # If there are alternative subjects, the test must be run against each
+        if is_test(method) and self.alternative_subject_types():
+            setattr(self, methodName, self.with_alternatives(getattr(self, methodName)))
+
     @classmethod
     @abstractmethod
     def subject_type(cls):
@@ -32,6 +59,27 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
         """
         pass
 
+    @classmethod
+    def alternative_subject_types(cls) -> Optional[Dict[str, Callable]]:
+        """
+        Defines alternative subject callables (e.g. optimised replacements
+        for the subject) to run every test against as well, keyed by name.
+        Their regression results are checked against those of the main
+        subject, and their performance is compared to it.
+        By default there are no alternative subjects.
+        """
+        return None
+
+    @classmethod
+    def alternative_timing_rounds(cls) -> int:
+        """
+        Defines the number of rounds in which each test is timed against
+        the main and alternative subjects, alternating the order of the
+        subjects each round. The fastest round is reported for each subject.
+        By default there are 3 rounds.
+        """
+        return 3
+
     @classmethod
     def common_resources(cls) -> Optional[Tuple[Any, ...]]:
         """
@@ -57,6 +105,26 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
         """
         return None
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        # Make sure the regression files are rescanned for this run
+        cls._regression_manifest = None
+
+        # Start a new performance comparison for this run
+        cls._subject_times = None
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.report_orphaned_regression_files()
+
+        # Report the performance comparison of the alternative subjects
+        if cls.__dict__.get("_subject_times", None):
+            sys.stderr.write(cls.format_performance_table())
+
+        super().tearDownClass()
+
     def setUp(self) -> None:
         # Get the method being tested
         test_method = self.get_test_method()
@@ -66,12 +134,32 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
         if skip_reason is not None:
             self.skipTest(skip_reason)
 
+    @classmethod
+    def create_subject(cls, subject_type: Callable, *args, **kwargs) -> Any:
+        """
+        Creates a test subject from the given subject callable (the main
+        subject or one of the alternatives) with the given arguments. Can
+        be overridden to customise how subjects are constructed, for the
+        main and alternative subjects alike.
+        """
+        return subject_type(*args, **kwargs)
+
     @classmethod
     def instantiate_subject(cls, *args, **kwargs) -> Any:
         """
         Instantiates a test subject with the given arguments.
         """
-        return cls.subject_type()(*args, **kwargs)
+        return cls.create_subject(cls.subject_type(), *args, **kwargs)
+
+    def instantiate_current_subject(self, *args, **kwargs) -> Any:
+        """
+        Instantiates the subject currently being tested (either the main
+        subject or one of the alternatives) with the given arguments.
+        """
+        if self._alternative is None:
+            return self.instantiate_subject(*args, **kwargs)
+
+        return self.create_subject(self.alternative_subject_types()[self._alternative], *args, **kwargs)
 
     def subject(self) -> Any:
         # Get the arguments to use to create the test subject from the test method
@@ -79,17 +167,156 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
 
         # If there are arguments, use them
         if subject_args is not None:
-            return self.instantiate_subject(*subject_args[0], **subject_args[1])
+            return self.instantiate_current_subject(*subject_args[0], **subject_args[1])
 
         # If not, try using the default arguments
         subject_args = self.common_arguments()
 
         # If there are default arguments, use them
         if subject_args is not None:
-            return self.instantiate_subject(*subject_args[0], **subject_args[1])
+            return self.instantiate_current_subject(*subject_args[0], **subject_args[1])
 
         # Otherwise use the default constructor
-        return self.instantiate_subject()
+        return self.instantiate_current_subject()
+
+    def with_alternatives(self, method):
+        """
+        Wraps a test method so that it is run against the main
+        subject and then against each of the alternative subjects.
+
+        :param method:  The (bound) test method.
+        :return:        The wrapped method, bound to this instance (so that
+                        unittest's loader still treats it as a method).
+        """
+        @functools.wraps(method)
+        def when_called(test: AbstractTest):
+            # Run against the main subject first, to get the results to check against
+            test._alternative = None
+            test._primary_results = {}
+            test._subject_time = 0.0
+            method()
+            checked = {None: test._subject_time}
+
+            # Run against each alternative as a separate sub-test. These checked
+            # runs also warm up each subject before it is timed
+            for name in test.alternative_subject_types():
+                with test.subTest(subject=name):
+                    test._alternative = name
+                    test._subject_time = 0.0
+                    try:
+                        method()
+                    finally:
+                        test._alternative = None
+                    checked[name] = test._subject_time
+
+            # There's no performance to compare when only regenerating baselines
+            if is_updating_baselines():
+                return
+
+            # Tests which time many executions themselves keep the times of their
+            # checked runs. Otherwise, time the subjects whose checked run completed
+            # over several rounds, alternating their order so none benefits from
+            # its position, and keep the fastest
+            if is_self_timed(method):
+                fastest = checked
+            else:
+                fastest = {}
+                for round_index in range(test.alternative_timing_rounds()):
+                    for name in (list(checked) if round_index % 2 == 0 else reversed(list(checked))):
+                        seconds = test.time_subject(method, name)
+                        fastest[name] = min(fastest.get(name, seconds), seconds)
+
+            # Add the times to this run's table of times for the test-class
+            subject_times = type(test).__dict__.get("_subject_times", None)
+            if subject_times is None:
+                subject_times = {}
+                type(test)._subject_times = subject_times
+            test_times = subject_times.setdefault(test.get_test_method_name(), {})
+            for name, seconds in fastest.items():
+                test._alternative = name
+                test_times[test.get_current_subject_name()] = seconds
+            test._alternative = None
+
+        return types.MethodType(when_called, self)
+
+    def time_subject(self, method, name: Optional[str]) -> float:
+        """
+        Re-runs a test against one of the subjects, without checking
+        its regression results, to time the subject.
+
+        :param method:  The (bound) test method.
+        :param name:    The name of the alternative subject,
+                        or None for the main subject.
+        :return:        The time the subject spent executing the test body.
+        """
+        self._alternative = name
+        self._timing = True
+        self._subject_time = 0.0
+        try:
+            method()
+        finally:
+            self._alternative = None
+            self._timing = False
+
+        return self._subject_time
+
+    def record_subject_time(self, seconds: float):
+        """
+        Records the time the current subject took to execute the
+        current test, for comparing the performance of alternative
+        subjects.
+
+        :param seconds:     The execution time.
+        """
+        # Accumulate the time (a test may execute its subject more than once)
+        self._subject_time += seconds
+
+    def get_current_subject_name(self) -> str:
+        """
+        Gets the name of the subject currently being tested.
+
+        :return:    The name of the alternative, or the main
+                    subject's qualified name.
+        """
+        if self._alternative is None:
+            return self.subject_type().__qualname__
+
+        return self._alternative
+
+    @classmethod
+    def format_performance_table(cls) -> str:
+        """
+        Formats the execution times of the main and alternative subjects
+        for each test as a table, with each alternative's time relative
+        to the main subject's.
+
+        :return:    The formatted table.
+        """
+        main_name = cls.subject_type().__qualname__
+        subject_names = [main_name, *(cls.alternative_subject_types() or {})]
+        subject_times = cls.__dict__.get("_subject_times", None) or {}
+
+        # Create the rows of the table
+        rows = [["test", *subject_names]]
+        for test_name in sorted(subject_times):
+            test_times = subject_times[test_name]
+            main_time = test_times.get(main_name, None)
+            row = [test_name]
+            for subject_name in subject_names:
+                if subject_name not in test_times:
+                    row.append("-")
+                elif main_time:
+                    row.append("%.6fs (%.3gx)" % (test_times[subject_name], test_times[subject_name] / main_time))
+                else:
+                    row.append("%.6fs" % test_times[subject_name])
+            rows.append(row)
+
+        # Pad the columns to the same width
+        widths = [max(len(row[column]) for row in rows) for column in range(len(subject_names) + 1)]
+        lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+
+        return "\nPerformance of " + cls.__qualname__ + " (time relative to " + main_name + "):\n" + \
+               "\n".join(lines) + "\n"
 
     def handle_regression_results(self, results):
         """
@@ -98,16 +325,29 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
 
         :param results:     The results of the regression test.
         """
+        # The results were already checked before the test was re-run for timing
+        if self._timing:
+            return
+
         # Make sure the regression results are a named map
         if not isinstance(results, dict) or not all(isinstance(key, str) for key in results):
             self.fail("Regression test '" +
                       self.get_test_method_name() +
                       "' didn't return a named map of regression results")
 
+        # Alternative subjects must produce the same results as the main subject
+        if self._alternative is not None and set(results) != set(self._primary_results):
+            self.fail("Alternative subject '" + self._alternative + "' produced regression results " +
+                      str(sorted(results)) + ", but " + self.subject_type().__qualname__ +
+                      " produced " + str(sorted(self._primary_results)))
+
         # Handle each result individually
         for name, result in results.items():
             self.handle_regression_result(name, result)
 
+        # All of this test's regression files have now been seen
+        self.get_regression_manifest().mark_complete(self.get_test_method_name())
+
     def handle_regression_result(self, name: str, result: Any):
         """
         Handles the comparison of an individual regression result
@@ -116,6 +356,10 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
         :param name:    The name of the regression to use.
         :param result:  The result of the regression test.
         """
+        # Keep the main subject's results to check the alternatives against
+        if self._alternative is None:
+            self._primary_results[name] = result
+
         # Treat each individual regression result as a sub-test
         with self.subTest(regression=name):
             # Get the serialisers for this test method
@@ -135,22 +379,115 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
             if serialiser is None:
                 self.fail("No regression serialiser found for result of type: " + type(result).__name__)
 
+            # Check alternative subjects against the main subject rather than the stored reference
+            if self._alternative is not None:
+                failure_message: str = serialiser.compare(result, self._primary_results[name])
+                if failure_message is not None:
+                    self.fail("Alternative subject '" + self._alternative + "' differs from " +
+                              self.subject_type().__qualname__ + ": " +
+                              serialiser.__name__ + ": " + failure_message)
+                return
+
             # Complete the file path for this result
             filename: str = os.path.join(self.get_regression_path(), self.get_test_method_name(), name)
 
+            # Get the index of the existing regression files
+            manifest = self.get_regression_manifest()
+
+            # If we're regenerating baselines, overwrite the regression file
+            if is_updating_baselines():
+                self.update_regression_baseline(serialiser, result, filename)
+
             # If the regression file doesn't exist yet, create it
-            if not serialiser.exists(filename):
-                serialiser.save(result, filename)
+            elif not serialiser.exists(filename, manifest):
+                serialiser.save(result, filename, manifest)
 
             # Otherwise load and check the saved result
             else:
-                reference = serialiser.load(filename)
+                reference = serialiser.load(filename, manifest)
 
                 # Use the serialiser's notion of equality
                 failure_message: str = serialiser.compare(result, reference)
                 if failure_message is not None:
                     self.fail(serialiser.__name__ + ": " + failure_message)
 
+    @classmethod
+    def update_regression_baseline(cls, serialiser: Type[RegressionSerialiser], result: Any, filename: str):
+        """
+        Overwrites the stored reference for a regression result with
+        the result itself, recording whether it was new, changed or
+        unchanged.
+
+        :param serialiser:  The serialiser for the result.
+        :param result:      The result of the regression test.
+        :param filename:    The filename of the stored reference.
+        """
+        # Get the index of the existing regression files
+        manifest = cls.get_regression_manifest()
+
+        # Determine how the result differs from the existing reference
+        if not serialiser.exists(filename, manifest):
+            outcome = BASELINE_NEW
+        else:
+            reference = None
+            try:
+                reference = serialiser.load(filename, manifest)
+                unchanged = not serialiser.changed(result, reference)
+            except Exception:
+                # A reference that can't be read back is stale
+                unchanged = False
+
+            # Release the reference before its file is overwritten, as it
+            # may be memory-mapped from the file (see PickleSerialiser)
+            del reference
+
+            outcome = BASELINE_UNCHANGED if unchanged else BASELINE_CHANGED
+
+        # Only touch the file if the result is different
+        if outcome != BASELINE_UNCHANGED:
+            serialiser.save(result, filename, manifest)
+
+        record_baseline_update(serialiser.extend(filename), outcome)
+
+    @classmethod
+    def get_regression_manifest(cls) -> RegressionManifest:
+        """
+        Gets the index of the regression files stored for this test-class,
+        scanning the regression path on first use.
+
+        :return:    The manifest.
+        """
+        # Each test-class keeps its own manifest
+        manifest = cls.__dict__.get("_regression_manifest", None)
+
+        if manifest is None:
+            manifest = RegressionManifest.scan(cls.get_regression_path())
+            cls._regression_manifest = manifest
+
+        return manifest
+
+    @classmethod
+    def report_orphaned_regression_files(cls):
+        """
+        Warns about any regression files stored for the regression tests
+        this test-class ran which they no longer produce. Files of unknown
+        tests aren't reported, as they may belong to test-classes for the
+        same subject which weren't loaded (the bulk regeneration run, which
+        loads the whole suite, reports those).
+        """
+        # If no regression tests were run, there's nothing to report
+        manifest = cls.__dict__.get("_regression_manifest", None)
+        if manifest is None:
+            return
+
+        orphans = manifest.orphans()
+
+        if len(orphans) > 0:
+            warnings.warn(OrphanedRegressionWarning(
+                "Regression files not produced by any test in " + cls.__qualname__ + ":\n" +
+                "\n".join("    " + filename for filename in orphans)
+            ))
+
     @classmethod
     def get_regression_root_path(cls) -> str:
         """
@@ -184,6 +521,42 @@ class AbstractTest(TestCase, metaclass=AbstractTestMeta):
         # Replace the dots with platform-dependent slashes
         return fully_qualified_name.replace(".", os.sep)
 
+    @classmethod
+    def get_regression_test_names(cls) -> Set[str]:
+        """
+        Gets the names of the regression tests in this test-class. These
+        are also the names of the directories their results are stored in.
+
+        :return:    The set of regression test names.
+        """
+        return {getattr(cls, name).__name__
+                for name in dir(cls)
+                if is_regression_test(getattr(cls, name))}
+
+    @classmethod
+    def get_known_regression_test_names(cls) -> Set[str]:
+        """
+        Gets the names of the regression tests in all loaded test-classes
+        which store their results under the same path as this one (e.g.
+        test-classes for the same subject).
+
+        :return:    The set of regression test names.
+        """
+        path = os.path.abspath(cls.get_regression_path())
+
+        # Search all concrete test-classes
+        names = set()
+        test_classes = [AbstractTest]
+        while len(test_classes) > 0:
+            test_class = test_classes.pop()
+            test_classes.extend(test_class.__subclasses__())
+
+            if not inspect.isabstract(test_class) and \
+                    os.path.abspath(test_class.get_regression_path()) == path:
+                names.update(test_class.get_regression_test_names())
+
+        return names
+
     def get_serialisers(self) -> Dict[Type, Type[RegressionSerialiser]]:
         """
         Gets the serialisers to use for this test method.
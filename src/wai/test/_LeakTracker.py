@@ -0,0 +1,197 @@
+import gc
+import os
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional
+
+
+class LeakTracker:
+    """
+    Tracks the number of live objects of each type, the resident set
+    size and the memory allocated by Python across repeated executions
+    of a test, to detect growth that indicates a leak.
+    """
+    def __init__(self):
+        # The number of live objects of each type at each sample
+        self.object_counts: List[Dict[str, int]] = []
+
+        # The resident set size at each sample (if available)
+        self.rss: List[Optional[int]] = []
+
+        # The memory allocated by Python at each sample
+        self.traced: List[int] = []
+
+        # Snapshots of allocations at the first and last samples
+        self._first_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._last_snapshot: Optional[tracemalloc.Snapshot] = None
+
+        # The memory allocated by the samples themselves
+        self._overhead: int = 0
+
+        # Whether this tracker turned on tracing (and so should turn it off)
+        self._started_tracing: bool = False
+
+    def start(self):
+        """
+        Starts tracking.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        # Warm up the sampling itself, so that its one-off allocations
+        # (ABC caches, lazy imports, etc.) aren't mistaken for growth
+        count_objects()
+        tracemalloc.take_snapshot()
+
+    def stop(self):
+        """
+        Stops tracking.
+        """
+        self._last_snapshot = tracemalloc.take_snapshot()
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def sample(self):
+        """
+        Records the current state of memory.
+        """
+        # Only count what can't be reclaimed
+        gc.collect()
+
+        # Take the initial snapshot first so that it's counted in every sample
+        if self._first_snapshot is None:
+            self._first_snapshot = tracemalloc.take_snapshot()
+
+        # Measure the allocated memory before sampling allocates anything itself
+        traced = tracemalloc.get_traced_memory()[0]
+        self.traced.append(traced - self._overhead)
+
+        self.object_counts.append(count_objects())
+        self.rss.append(get_rss())
+
+        # Exclude the memory retained by this sample from future samples
+        self._overhead += tracemalloc.get_traced_memory()[0] - traced
+
+    def growing_types(self, threshold: int) -> Dict[str, int]:
+        """
+        Gets the types whose number of live objects grew monotonically
+        across all samples, by more than the given threshold.
+
+        :param threshold:   The amount of growth allowed.
+        :return:            The map from type name to growth.
+        """
+        growing = {}
+        for name, final_count in self.object_counts[-1].items():
+            counts = [sample.get(name, 0) for sample in self.object_counts]
+
+            if is_monotonic(counts) and final_count - counts[0] > threshold:
+                growing[name] = final_count - counts[0]
+
+        return growing
+
+    def leaks(self,
+              object_threshold: int,
+              memory_threshold: int,
+              rss_threshold: int) -> List[str]:
+        """
+        Describes any growth across the samples that indicates a leak.
+
+        :param object_threshold:    The growth in the number of objects of any one type allowed.
+        :param memory_threshold:    The growth in memory allocated by Python allowed, in bytes.
+        :param rss_threshold:       The growth in resident set size allowed, in bytes.
+        :return:                    The descriptions of the leaks, or an empty list if none.
+        """
+        leaks = []
+
+        # Report the types which accumulated, most growth first
+        growing = self.growing_types(object_threshold)
+        for name in sorted(growing, key=growing.get, reverse=True):
+            leaks.append(name + ": " +
+                         str(self.object_counts[0].get(name, 0)) + " -> " +
+                         str(self.object_counts[-1][name]) + " objects")
+
+        # Report growth of the memory allocated by Python, and where it was allocated
+        if is_monotonic(self.traced) and self.traced[-1] - self.traced[0] > memory_threshold:
+            leaks.append("allocated memory: " +
+                         str(self.traced[0]) + " -> " +
+                         str(self.traced[-1]) + " bytes")
+            leaks.extend("    " + str(statistic) for statistic in self.growing_allocations())
+
+        # Report growth of the resident set size (if it could be measured)
+        if None not in self.rss and is_monotonic(self.rss) and self.rss[-1] - self.rss[0] > rss_threshold:
+            leaks.append("resident set size: " +
+                         str(self.rss[0]) + " -> " +
+                         str(self.rss[-1]) + " bytes")
+
+        return leaks
+
+    def growing_allocations(self, limit: int = 5) -> List[tracemalloc.StatisticDiff]:
+        """
+        Gets the source lines whose allocations grew the most between
+        the first and last samples.
+
+        :param limit:   The maximum number of lines to get.
+        :return:        The allocation differences for those lines.
+        """
+        if self._first_snapshot is None or self._last_snapshot is None:
+            return []
+
+        # Ignore the allocations made by the tracking itself
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, __file__)]
+        first = self._first_snapshot.filter_traces(filters)
+        last = self._last_snapshot.filter_traces(filters)
+
+        return [statistic
+                for statistic in last.compare_to(first, "lineno")
+                if statistic.size_diff > 0][:limit]
+
+
+def count_objects() -> Dict[str, int]:
+    """
+    Counts the live objects of each type.
+
+    :return:    The map from type name to count, as a plain dict
+                (which isn't tracked by gc, so doesn't count itself).
+    """
+    counts = Counter(map(type, gc.get_objects()))
+
+    return {type_name(object_type): count for object_type, count in counts.items()}
+
+
+def type_name(object_type: type) -> str:
+    """
+    Gets the fully-qualified name of a type.
+
+    :param object_type:     The type.
+    :return:                The name of the type.
+    """
+    return object_type.__module__ + "." + object_type.__qualname__
+
+
+def is_monotonic(values: List[int]) -> bool:
+    """
+    Whether the given values never decrease.
+
+    :param values:  The values to check.
+    :return:        True if the values never decrease,
+                    False if they do.
+    """
+    return all(later >= earlier for earlier, later in zip(values, values[1:]))
+
+
+def get_rss() -> Optional[int]:
+    """
+    Gets the current resident set size of this process.
+
+    :return:    The resident set size in bytes, or None if it can't be
+                determined on this platform.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
@@ -0,0 +1,6 @@
+class OrphanedRegressionWarning(UserWarning):
+    """
+    Warning issued when stored regression files are found
+    which no regression test produces any more.
+    """
+    pass
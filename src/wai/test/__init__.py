@@ -1 +1,2 @@
 from ._AbstractTest import AbstractTest, DEFAULT_REGRESSION_ROOT
+from ._OrphanedRegressionWarning import OrphanedRegressionWarning
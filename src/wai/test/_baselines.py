@@ -0,0 +1,49 @@
+"""
+Module for tracking updates to regression baselines.
+"""
+import os
+from typing import List, Tuple
+
+from ._constants import UPDATE_BASELINES_ENVIRONMENT_VARIABLE
+
+# The outcomes of updating a single baseline
+BASELINE_NEW: str = "new"
+BASELINE_CHANGED: str = "changed"
+BASELINE_UNCHANGED: str = "unchanged"
+
+# The baselines updated so far in this process, as (filename, outcome) pairs
+_updates: List[Tuple[str, str]] = []
+
+
+def is_updating_baselines() -> bool:
+    """
+    Checks if regression tests should overwrite their baselines
+    rather than comparing against them.
+
+    :return:    True if baselines are being updated,
+                False if they are being compared against.
+    """
+    return os.environ.get(UPDATE_BASELINES_ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+def record_baseline_update(filename: str, outcome: str):
+    """
+    Records that a baseline was updated.
+
+    :param filename:    The full filename of the baseline.
+    :param outcome:     One of BASELINE_NEW, BASELINE_CHANGED or BASELINE_UNCHANGED.
+    """
+    _updates.append((filename, outcome))
+
+
+def pop_baseline_updates() -> List[Tuple[str, str]]:
+    """
+    Gets the baseline updates recorded so far, and clears the record.
+
+    :return:    The (filename, outcome) pairs of the updates.
+    """
+    updates = list(_updates)
+
+    _updates.clear()
+
+    return updates
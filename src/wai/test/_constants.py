@@ -12,3 +12,14 @@ SKIP_ATTRIBUTE: str = "__skip"
 
 # Attribute of serialisers that the test method will use
 SERIALISERS_ATTRIBUTE: str = "__serialisers"
+
+# Attribute of test methods which are regression tests
+REGRESSION_TEST_ATTRIBUTE: str = "__regression_test"
+
+# Attribute of test methods which time the subject over many executions
+# themselves, so aren't re-run to compare alternative subjects' performance
+SELF_TIMED_ATTRIBUTE: str = "__self_timed"
+
+# Environment variable which, when set, causes regression tests to
+# overwrite their baselines instead of comparing against them
+UPDATE_BASELINES_ENVIRONMENT_VARIABLE: str = "WAI_TEST_UPDATE_BASELINES"
@@ -18,6 +18,28 @@ def is_test(method) -> bool:
     return getattr(method, _constants.IS_TEST_ATTRIBUTE, False)
 
 
+def is_regression_test(method) -> bool:
+    """
+    Checks if the given method is a regression test method.
+
+    :param method:  The method to check.
+    :return:        True if the method is a regression test method,
+                    False if not.
+    """
+    return getattr(method, _constants.REGRESSION_TEST_ATTRIBUTE, False)
+
+
+def is_self_timed(method) -> bool:
+    """
+    Checks if the given method is a test method which does its own timing.
+
+    :param method:  The method to check.
+    :return:        True if the method does its own timing,
+                    False if not.
+    """
+    return getattr(method, _constants.SELF_TIMED_ATTRIBUTE, False)
+
+
 def get_skip_reason(method) -> Optional[str]:
     """
     Checks if the given test method should be skipped.
@@ -0,0 +1,58 @@
+"""
+Module for helper functions for loading and selecting tests from
+the command line.
+"""
+import fnmatch
+from typing import Iterator, List, Optional
+from unittest import TestSuite, TestCase, defaultTestLoader
+
+
+def load_tests(names: List[str],
+               start_directory: str = ".",
+               pattern: str = "test*.py") -> TestSuite:
+    """
+    Loads tests in the same way as the unittest command line. If
+    names are given, they are loaded directly, otherwise tests are
+    discovered.
+
+    :param names:               The names of modules, classes or methods to load.
+    :param start_directory:     The directory to start discovery from.
+    :param pattern:             The pattern test modules must match to be discovered.
+    :return:                    The loaded tests.
+    """
+    if len(names) > 0:
+        return defaultTestLoader.loadTestsFromNames(names)
+
+    return defaultTestLoader.discover(start_directory, pattern)
+
+
+def iterate_tests(suite: TestSuite) -> Iterator[TestCase]:
+    """
+    Iterates over the individual tests in a (possibly nested) suite.
+
+    :param suite:   The suite to iterate over.
+    :return:        An iterator over the tests.
+    """
+    for test in suite:
+        if isinstance(test, TestSuite):
+            yield from iterate_tests(test)
+        else:
+            yield test
+
+
+def matches(test: TestCase, patterns: Optional[List[str]]) -> bool:
+    """
+    Checks if the given test matches any of the given patterns, in the
+    same way as unittest's -k option (patterns without wildcards match
+    as substrings).
+
+    :param test:        The test to check.
+    :param patterns:    The patterns to match against, or None to match all tests.
+    :return:            True if the test matches,
+                        False if not.
+    """
+    if not patterns:
+        return True
+
+    return any(fnmatch.fnmatchcase(test.id(), pattern if "*" in pattern else "*" + pattern + "*")
+               for pattern in patterns)
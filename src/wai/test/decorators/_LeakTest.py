@@ -0,0 +1,80 @@
+import functools
+import time
+
+from ._Test import Test
+from .. import AbstractTest
+from .._LeakTracker import LeakTracker
+from .._constants import SELF_TIMED_ATTRIBUTE
+
+
+def LeakTest(iterations: int = 50,
+             warmup: int = 5,
+             reuse_subject: bool = False,
+             object_threshold: int = 10,
+             memory_threshold: int = 1024 * 1024,
+             rss_threshold: int = 16 * 1024 * 1024):
+    """
+    Decorator that specifies a test which is executed repeatedly, and
+    fails if the number of live objects of any type, the memory allocated
+    by Python, or the resident set size grows across every execution by
+    more than a threshold.
+
+    :param iterations:          The number of executions to track.
+    :param warmup:              The number of executions before tracking starts
+                                (so that caches etc. can fill).
+    :param reuse_subject:       Whether to execute against the same subject each time,
+                                rather than a fresh subject for each execution.
+    :param object_threshold:    The growth in the number of objects of any one type allowed.
+    :param memory_threshold:    The growth in memory allocated by Python allowed, in bytes.
+    :param rss_threshold:       The growth in resident set size allowed, in bytes.
+    """
+    def applicator(method):
+        # Make the method a test
+        test_method = Test(method)
+
+        # Wrap the method with the leak-tracking infrastructure
+        @functools.wraps(test_method)
+        def when_called(test: AbstractTest):
+            # Create the function which executes the test once
+            if reuse_subject:
+                subject = test.subject()
+                resources = test.common_resources()
+                if resources is None:
+                    resources = tuple()
+
+                # Time the execution, as the test wrapper (which isn't used) would
+                def execute():
+                    start = time.perf_counter()
+                    try:
+                        method(test, subject, *resources)
+                    finally:
+                        test.record_subject_time(time.perf_counter() - start)
+            else:
+                def execute():
+                    test_method(test)
+
+            for _ in range(warmup):
+                execute()
+
+            # Sample before and after every execution
+            tracker = LeakTracker()
+            tracker.start()
+            try:
+                tracker.sample()
+                for _ in range(iterations):
+                    execute()
+                    tracker.sample()
+            finally:
+                tracker.stop()
+
+            leaks = tracker.leaks(object_threshold, memory_threshold, rss_threshold)
+            if len(leaks) > 0:
+                test.fail("Growth detected over " + str(iterations) + " executions:\n" +
+                          "\n".join(leaks))
+
+        # Label the method as timing itself (over all its executions)
+        setattr(when_called, SELF_TIMED_ATTRIBUTE, True)
+
+        return when_called
+
+    return applicator
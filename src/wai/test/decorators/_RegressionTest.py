@@ -2,6 +2,7 @@ import functools
 
 from ._Test import Test
 from .. import AbstractTest
+from .._constants import REGRESSION_TEST_ATTRIBUTE
 
 
 def RegressionTest(method):
@@ -18,4 +19,7 @@ def RegressionTest(method):
 
         test.handle_regression_results(results)
 
+    # Label the method as a regression test
+    setattr(when_called, REGRESSION_TEST_ATTRIBUTE, True)
+
     return when_called
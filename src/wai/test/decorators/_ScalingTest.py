@@ -0,0 +1,102 @@
+import functools
+import time
+
+from ._Test import Test
+from ._WithSerialiser import WithSerialiser
+from .. import AbstractTest
+from .._constants import REGRESSION_TEST_ATTRIBUTE, SELF_TIMED_ATTRIBUTE
+from ..scaling import Complexity, ScalingResult, geometric_sizes, fit_exponent
+from ..serialisation import ScalingSerialiser
+
+
+def ScalingTest(bound: Complexity,
+                min_size: int = 128,
+                max_size: int = 8192,
+                factor: float = 2,
+                repeats: int = 5,
+                tolerance: float = 0.25):
+    """
+    Decorator that specifies a test which times the subject over a
+    geometric range of input sizes, and fails if the execution time
+    grows faster than the given bound. The fitted exponent of the
+    growth is also stored as a regression result, and the test fails
+    if it exceeds the stored reference by more than the tolerance.
+
+    The test method receives the size as an argument after the subject.
+    It can either do the work itself, or return a callable (taking no
+    arguments) which does the work, in which case only the callable is
+    timed (so that preparing the input isn't).
+
+    :param bound:       The order of growth the execution time should not exceed.
+    :param min_size:    The smallest input size.
+    :param max_size:    The largest input size.
+    :param factor:      The ratio between consecutive input sizes.
+    :param repeats:     The number of times to time each size (the fastest is used).
+    :param tolerance:   How far the fitted exponent may exceed the bound or the reference.
+    """
+    # Check the range of sizes is usable (the smallest size must be at
+    # least 2, as some bounds, e.g. log(n), are zero at 1)
+    if min_size < 2:
+        raise ValueError("min_size must be at least 2, got " + str(min_size))
+    if factor <= 1:
+        raise ValueError("factor must be greater than 1, got " + str(factor))
+    sizes = geometric_sizes(min_size, max_size, factor)
+    if len(sizes) < 2:
+        raise ValueError("Need at least 2 distinct sizes to fit the growth, got " + str(sizes))
+
+    def applicator(method):
+        # Make the method a test
+        Test(method)
+
+        # Wrap the method with the scaling infrastructure
+        @functools.wraps(method)
+        def when_called(test: AbstractTest):
+            resources = test.common_resources()
+            if resources is None:
+                resources = tuple()
+
+            # Time the fastest execution at each size, with a fresh subject each time
+            times = []
+            for size in sizes:
+                fastest = None
+                for _ in range(repeats):
+                    subject = test.subject()
+
+                    start = time.perf_counter()
+                    work = method(test, subject, size, *resources)
+                    elapsed = time.perf_counter() - start
+
+                    # If the method prepared the work, time only the work
+                    if callable(work):
+                        start = time.perf_counter()
+                        work()
+                        elapsed = time.perf_counter() - start
+
+                    if fastest is None or elapsed < fastest:
+                        fastest = elapsed
+
+                times.append(fastest)
+            test.record_subject_time(sum(times))
+
+            # Fit the growth relative to the bound (flat if it grows no faster)
+            relative_exponent = fit_exponent(sizes, [elapsed / bound(size) for size, elapsed in zip(sizes, times)])
+            if relative_exponent > tolerance:
+                test.fail("Execution time grows faster than " + str(bound) + ": " +
+                          "fitted exponent relative to bound is " + format(relative_exponent, ".3f") + "\n" +
+                          "\n".join("    n=" + str(size) + ": " + format(elapsed, ".6f") + "s"
+                                    for size, elapsed in zip(sizes, times)))
+
+            # Check the overall growth against the reference
+            test.handle_regression_results({
+                "scaling": ScalingResult(fit_exponent(sizes, times), tolerance)
+            })
+
+        # Label the method as a regression test, storing its result as such
+        setattr(when_called, REGRESSION_TEST_ATTRIBUTE, True)
+
+        # Label the method as timing itself (the fastest of several executions per size)
+        setattr(when_called, SELF_TIMED_ATTRIBUTE, True)
+
+        return WithSerialiser(ScalingResult, ScalingSerialiser)(when_called)
+
+    return applicator
@@ -1,4 +1,5 @@
 import functools
+import time
 
 from .. import AbstractTest
 from .._constants import IS_TEST_ATTRIBUTE
@@ -24,9 +25,14 @@ def Test(method):
         subject = test.subject()
         resources = test.common_resources()
 
-        if resources is not None:
-            return method(test, subject, *resources)
-        else:
-            return method(test, subject)
+        # Time the test body, to compare the performance of alternative subjects
+        start = time.perf_counter()
+        try:
+            if resources is not None:
+                return method(test, subject, *resources)
+            else:
+                return method(test, subject)
+        finally:
+            test.record_subject_time(time.perf_counter() - start)
 
     return when_called
@@ -1,6 +1,8 @@
 from ._ExceptionTest import ExceptionTest
 from ._ExpectedFailure import ExpectedFailure
+from ._LeakTest import LeakTest
 from ._RegressionTest import RegressionTest
+from ._ScalingTest import ScalingTest
 from ._Skip import Skip
 from ._SubjectArgs import SubjectArgs
 from ._Test import Test
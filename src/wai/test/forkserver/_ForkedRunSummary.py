@@ -0,0 +1,73 @@
+from typing import List, Tuple
+
+# The outcomes of an individual test
+SUCCESS: str = "success"
+FAILURE: str = "failure"
+ERROR: str = "error"
+SKIPPED: str = "skipped"
+EXPECTED_FAILURE: str = "expected failure"
+UNEXPECTED_SUCCESS: str = "unexpected success"
+
+
+class ForkedRunSummary:
+    """
+    Summary of running tests in forked worker processes.
+    """
+    def __init__(self):
+        # The (test id, outcome, details) of each test result
+        self.records: List[Tuple[str, str, str]] = []
+
+        # The total time taken to run the tests, in seconds
+        self.time_taken: float = 0.0
+
+    def count(self, outcome: str) -> int:
+        """
+        Counts the test results with the given outcome.
+
+        :param outcome:     The outcome to count.
+        :return:            The number of results with that outcome.
+        """
+        return sum(1 for _, record_outcome, _ in self.records if record_outcome == outcome)
+
+    def was_successful(self) -> bool:
+        """
+        Whether all tests passed.
+
+        :return:    True if no test failed, errored or unexpectedly succeeded,
+                    False otherwise.
+        """
+        return self.count(FAILURE) == 0 and self.count(ERROR) == 0 and self.count(UNEXPECTED_SUCCESS) == 0
+
+    def format(self) -> str:
+        """
+        Formats the summary as human-readable text, in the style of unittest.
+
+        :return:    The formatted summary.
+        """
+        lines = []
+
+        # Give the details of each problem
+        for test_id, outcome, details in self.records:
+            if outcome in (ERROR, FAILURE):
+                lines.append("=" * 70)
+                lines.append(("ERROR" if outcome == ERROR else "FAIL") + ": " + test_id)
+                lines.append("-" * 70)
+                lines.append(details.rstrip())
+                lines.append("")
+
+        lines.append("-" * 70)
+        lines.append("Ran " + str(len(self.records)) + " test results in " + format(self.time_taken, ".3f") + "s")
+        lines.append("")
+
+        # Finish with the counts of each outcome, as unittest does
+        counts = ", ".join(name + "=" + str(self.count(outcome))
+                           for name, outcome in (("failures", FAILURE),
+                                                 ("errors", ERROR),
+                                                 ("skipped", SKIPPED),
+                                                 ("expected failures", EXPECTED_FAILURE),
+                                                 ("unexpected successes", UNEXPECTED_SUCCESS))
+                           if self.count(outcome) > 0)
+        status = "OK" if self.was_successful() else "FAILED"
+        lines.append(status + (" (" + counts + ")" if counts != "" else ""))
+
+        return "\n".join(lines) + "\n"
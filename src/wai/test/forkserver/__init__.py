@@ -0,0 +1,7 @@
+"""
+Package for running tests in isolated worker processes, forked from
+a template process with the test and subject modules pre-imported.
+Can be run from the command line as 'python -m wai.test.forkserver'.
+"""
+from ._ForkedRunSummary import ForkedRunSummary
+from ._run import run_forked
@@ -0,0 +1,35 @@
+import argparse
+import sys
+
+from .._suites import load_tests
+from ._run import run_forked
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m wai.test.forkserver",
+        description="Runs each test-class in its own process, forked from a template process "
+                    "which has pre-imported the test and subject modules.")
+    parser.add_argument("names", nargs="*",
+                        help="modules, classes or methods to load tests from (discovers tests if none given)")
+    parser.add_argument("-s", "--start-directory", default=".",
+                        help="directory to start discovery from (default: %(default)s)")
+    parser.add_argument("-p", "--pattern", default="test*.py",
+                        help="pattern to match test modules during discovery (default: %(default)s)")
+    parser.add_argument("-k", dest="patterns", action="append",
+                        help="only run tests which match the pattern (can be given multiple times)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes to run at once (default: one per CPU)")
+    options = parser.parse_args()
+
+    summary = run_forked(load_tests(options.names, options.start_directory, options.pattern),
+                         options.patterns,
+                         options.workers)
+
+    sys.stderr.write(summary.format())
+
+    return 0 if summary.was_successful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
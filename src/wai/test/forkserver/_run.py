@@ -0,0 +1,196 @@
+import inspect
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from multiprocessing import forkserver
+from multiprocessing.connection import Connection, wait
+from typing import List, Optional, Dict, Set, Tuple
+from unittest import TestSuite, TestResult, TestCase, defaultTestLoader
+
+from .._AbstractTest import AbstractTest
+from .._suites import iterate_tests, matches
+from ._ForkedRunSummary import ForkedRunSummary, SUCCESS, FAILURE, ERROR, SKIPPED, \
+    EXPECTED_FAILURE, UNEXPECTED_SUCCESS
+
+
+def run_forked(suite: TestSuite,
+               patterns: Optional[List[str]] = None,
+               workers: Optional[int] = None) -> ForkedRunSummary:
+    """
+    Runs each test-class in the given suite in its own process, isolating
+    the classes from each other's crashes and global state. The worker
+    processes are forked from a template process which has already imported
+    the test modules and subject modules, so they don't pay the cost of
+    importing them again. Only available on platforms which support the
+    'forkserver' start method.
+
+    :param suite:       The suite of tests to run.
+    :param patterns:    Patterns selecting which tests to run (as for
+                        unittest's -k option), or None for all.
+    :param workers:     The number of worker processes to run at once,
+                        or None for one per CPU.
+    :return:            A summary of the test results.
+    """
+    # Group the selected tests by class, keeping their order
+    classes: Dict[str, List[str]] = {}
+    test_classes: List[type] = []
+    for test in iterate_tests(suite):
+        if matches(test, patterns):
+            name = type(test).__module__ + "." + type(test).__qualname__
+            if name not in classes:
+                classes[name] = []
+                test_classes.append(type(test))
+            classes[name].append(test.id())
+
+    # Start the template process, pre-importing everything the tests need
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(sorted(get_preload_modules(test_classes)))
+    start_template(context)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    summary = ForkedRunSummary()
+    start_time = time.perf_counter()
+
+    # Run up to the given number of classes at once
+    pending = list(classes.items())
+    running: Dict[Connection, Tuple[multiprocessing.Process, str, List[str]]] = {}
+    while len(pending) > 0 or len(running) > 0:
+        while len(pending) > 0 and len(running) < workers:
+            class_name, test_ids = pending.pop(0)
+            reader, writer = context.Pipe(duplex=False)
+            process = context.Process(target=run_tests, args=(test_ids, writer), name=class_name)
+            process.start()
+
+            # Only the worker should hold the writing end, so a crash closes the pipe
+            writer.close()
+            running[reader] = process, class_name, test_ids
+
+        # Collect the results of whichever workers finish
+        for reader in wait(list(running)):
+            process, class_name, test_ids = running.pop(reader)
+            try:
+                summary.records.extend(reader.recv())
+            except EOFError:
+                # The worker died without reporting
+                process.join()
+                summary.records.append((class_name,
+                                        ERROR,
+                                        "Worker process crashed with exit code " + str(process.exitcode) +
+                                        " while running:\n" + "\n".join(test_ids)))
+            reader.close()
+            process.join()
+
+    summary.time_taken = time.perf_counter() - start_time
+
+    return summary
+
+
+def get_preload_modules(test_classes: List[type]) -> Set[str]:
+    """
+    Gets the modules to pre-import in the template process: those defining
+    the test-classes and the subjects they test.
+
+    :param test_classes:    The test-classes to be run.
+    :return:                The names of the modules.
+    """
+    modules = {AbstractTest.__module__}
+    for test_class in test_classes:
+        modules.add(test_class.__module__)
+
+        # Add the modules of the subjects as well
+        if issubclass(test_class, AbstractTest) and not inspect.isabstract(test_class):
+            try:
+                subjects = [test_class.subject_type(), *(test_class.alternative_subject_types() or {}).values()]
+            except Exception:
+                continue
+            modules.update(subject.__module__ for subject in subjects if getattr(subject, "__module__", None))
+
+    # The main module is imported by each worker anyway
+    modules.discard("__main__")
+
+    return modules
+
+
+def start_template(context):
+    """
+    Starts the template process (if it isn't already running), making
+    sure it can import from the same path as this process.
+
+    :param context:     The 'forkserver' multiprocessing context.
+    """
+    original = os.environ.get("PYTHONPATH", None)
+    os.environ["PYTHONPATH"] = os.pathsep.join(path if path != "" else os.getcwd() for path in sys.path)
+    try:
+        forkserver.ensure_running()
+    finally:
+        if original is None:
+            del os.environ["PYTHONPATH"]
+        else:
+            os.environ["PYTHONPATH"] = original
+
+
+def run_tests(test_ids: List[str], connection: Connection):
+    """
+    Runs the given tests in a worker process, sending the records
+    of their results back over the connection.
+
+    :param test_ids:        The ids of the tests to run.
+    :param connection:      The connection to the parent process.
+    """
+    result = RecordingResult()
+
+    try:
+        defaultTestLoader.loadTestsFromNames(test_ids).run(result)
+    except Exception:
+        result.records.append((", ".join(test_ids), ERROR, traceback.format_exc()))
+
+    connection.send(result.records)
+    connection.close()
+
+
+class RecordingResult(TestResult):
+    """
+    Test result which records the outcome of each test in
+    a form that can be sent between processes.
+    """
+    def __init__(self):
+        super().__init__()
+
+        # The (test id, outcome, details) of each test result
+        self.records: List[Tuple[str, str, str]] = []
+
+    def addSuccess(self, test: TestCase):
+        super().addSuccess(test)
+        self.records.append((test.id(), SUCCESS, ""))
+
+    def addFailure(self, test: TestCase, err):
+        super().addFailure(test, err)
+        self.records.append((test.id(), FAILURE, self.failures[-1][1]))
+
+    def addError(self, test: TestCase, err):
+        super().addError(test, err)
+        self.records.append((test.id(), ERROR, self.errors[-1][1]))
+
+    def addSkip(self, test: TestCase, reason: str):
+        super().addSkip(test, reason)
+        self.records.append((test.id(), SKIPPED, reason))
+
+    def addExpectedFailure(self, test: TestCase, err):
+        super().addExpectedFailure(test, err)
+        self.records.append((test.id(), EXPECTED_FAILURE, self.expectedFailures[-1][1]))
+
+    def addUnexpectedSuccess(self, test: TestCase):
+        super().addUnexpectedSuccess(test)
+        self.records.append((test.id(), UNEXPECTED_SUCCESS, ""))
+
+    def addSubTest(self, test: TestCase, subtest: TestCase, err):
+        super().addSubTest(test, subtest, err)
+
+        # Successful sub-tests are counted by their parent test
+        if err is not None:
+            problems = self.failures if issubclass(err[0], test.failureException) else self.errors
+            self.records.append((subtest.id(), FAILURE if problems is self.failures else ERROR, problems[-1][1]))
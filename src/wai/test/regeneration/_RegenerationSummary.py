@@ -0,0 +1,54 @@
+from typing import List, Dict
+
+
+class RegenerationSummary:
+    """
+    Summary of a bulk regeneration of regression baselines.
+    """
+    def __init__(self):
+        # The baseline files that were created
+        self.new: List[str] = []
+
+        # The baseline files whose contents were overwritten
+        self.changed: List[str] = []
+
+        # The baseline files that already matched the results
+        self.unchanged: List[str] = []
+
+        # The baseline files which no test produced
+        self.orphaned: List[str] = []
+
+        # The tests which failed to run, and the reason they failed
+        self.failed: Dict[str, str] = {}
+
+    def format(self) -> str:
+        """
+        Formats the summary as human-readable text.
+
+        :return:    The formatted summary.
+        """
+        lines = []
+
+        # List the files in each category
+        for heading, filenames in (("New", self.new),
+                                   ("Changed", self.changed),
+                                   ("Orphaned", self.orphaned)):
+            if len(filenames) > 0:
+                lines.append(heading + " (" + str(len(filenames)) + "):")
+                lines.extend("    " + filename for filename in sorted(filenames))
+
+        # List the failed tests with the reason they failed
+        if len(self.failed) > 0:
+            lines.append("Failed (" + str(len(self.failed)) + "):")
+            for test_id in sorted(self.failed):
+                lines.append("    " + test_id)
+                lines.extend("        " + line for line in self.failed[test_id].splitlines())
+
+        # Finish with the totals
+        lines.append(str(len(self.new)) + " new, " +
+                     str(len(self.changed)) + " changed, " +
+                     str(len(self.unchanged)) + " unchanged, " +
+                     str(len(self.orphaned)) + " orphaned, " +
+                     str(len(self.failed)) + " failed")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,6 @@
+"""
+Package for regenerating regression baselines in bulk. Can be run from
+the command line as 'python -m wai.test.regeneration'.
+"""
+from ._regenerate import regenerate
+from ._RegenerationSummary import RegenerationSummary
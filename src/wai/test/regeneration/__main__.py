@@ -0,0 +1,42 @@
+import argparse
+import sys
+
+from .._suites import load_tests
+from ._regenerate import regenerate
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m wai.test.regeneration",
+        description="Re-runs regression tests in parallel, overwriting their stored baselines.")
+    parser.add_argument("names", nargs="*",
+                        help="modules, classes or methods to load tests from (discovers tests if none given)")
+    parser.add_argument("-s", "--start-directory", default=".",
+                        help="directory to start discovery from (default: %(default)s)")
+    parser.add_argument("-p", "--pattern", default="test*.py",
+                        help="pattern to match test modules during discovery (default: %(default)s)")
+    parser.add_argument("-k", dest="patterns", action="append",
+                        help="only regenerate tests which match the pattern (can be given multiple times)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (default: one per CPU)")
+    parser.add_argument("--summary", default=None,
+                        help="file to write the summary to (default: standard output)")
+    options = parser.parse_args()
+
+    summary = regenerate(load_tests(options.names, options.start_directory, options.pattern),
+                         options.patterns,
+                         options.workers,
+                         len(options.names) == 0)
+
+    # Write the summary
+    if options.summary is None:
+        sys.stdout.write(summary.format())
+    else:
+        with open(options.summary, "w") as file:
+            file.write(summary.format())
+
+    return 1 if len(summary.failed) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+import os
+import sys
+import traceback
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple, Set, Dict, Type, Union
+from unittest import TestSuite, TestResult, TestCase, defaultTestLoader
+
+from .._AbstractTest import AbstractTest
+from .._OrphanedRegressionWarning import OrphanedRegressionWarning
+from .._baselines import pop_baseline_updates, BASELINE_NEW, BASELINE_CHANGED, BASELINE_UNCHANGED
+from .._constants import UPDATE_BASELINES_ENVIRONMENT_VARIABLE
+from .._functions import is_regression_test
+from .._suites import iterate_tests, matches
+from ..serialisation import RegressionManifest
+from ._RegenerationSummary import RegenerationSummary
+
+# The id of a test, the baselines it updated (and how), the reason
+# it failed (or None), and whether it actually ran and passed
+TestRecord = Tuple[str, List[Tuple[str, str]], Optional[str], bool]
+
+
+def regenerate(suite: TestSuite,
+               patterns: Optional[List[str]] = None,
+               workers: Optional[int] = None,
+               whole_suite: bool = True) -> RegenerationSummary:
+    """
+    Re-runs the regression tests in the given suite in parallel, overwriting
+    their stored baselines with the current results.
+
+    :param suite:       The suite of tests to regenerate the baselines of.
+    :param patterns:    Patterns selecting which regression tests to regenerate
+                        (as for unittest's -k option), or None for all.
+    :param workers:     The number of worker processes, or None for one per CPU.
+    :param whole_suite: Whether the suite holds all the tests (e.g. was discovered
+                        rather than loaded by name), so that baselines of tests
+                        which no longer exist can be reported as orphaned.
+    :return:            A summary of the regenerated baselines.
+    """
+    # Get the regression tests in the suite
+    tests = [test
+             for test in iterate_tests(suite)
+             if isinstance(test, AbstractTest) and is_regression_test(test.get_test_method())]
+
+    # Select the tests to regenerate
+    selected = [test for test in tests if matches(test, patterns)]
+
+    summary = RegenerationSummary()
+    outcomes = {
+        BASELINE_NEW: summary.new,
+        BASELINE_CHANGED: summary.changed,
+        BASELINE_UNCHANGED: summary.unchanged
+    }
+
+    # Group the selected tests by class, so each class sets up and
+    # scans its regression directory once
+    classes: Dict[str, List[str]] = {}
+    for test in selected:
+        classes.setdefault(type(test).__module__ + "." + type(test).__qualname__, []).append(test.id())
+
+    # Run the test-classes in parallel
+    results = run_classes(classes, workers)
+
+    # A crashed worker breaks the whole pool, failing every class still to finish
+    # along with it, so re-run those in isolation to find which actually crashed
+    broken = [class_name for class_name, records in results.items() if isinstance(records, BrokenProcessPool)]
+    for class_name in broken:
+        results.update(run_classes({class_name: classes[class_name]}, 1))
+
+    # Collect the baselines each test updated
+    produced: Dict[str, List[str]] = {test.id(): [] for test in selected}
+    complete: Set[str] = set()
+    for class_name, records in results.items():
+        if isinstance(records, Exception):
+            summary.failed[class_name] = "Worker process failed (" + repr(records) + ") while running:\n" + \
+                                         "\n".join(classes[class_name])
+            continue
+
+        for test_id, updates, failure, passed in records:
+            for filename, outcome in updates:
+                filename = os.path.abspath(filename)
+                produced[test_id].append(filename)
+                outcomes[outcome].append(filename)
+
+            if failure is not None:
+                summary.failed[test_id] = failure
+
+            if passed:
+                complete.add(test_id)
+
+    # Find the baselines which none of the tests produced
+    summary.orphaned = find_orphans(selected, produced, complete, whole_suite)
+
+    return summary
+
+
+def run_classes(classes: Dict[str, List[str]],
+                workers: Optional[int]) -> Dict[str, Union[List[TestRecord], Exception]]:
+    """
+    Regenerates each test-class as a single task in a pool of worker processes.
+
+    :param classes:     The ids of the tests to regenerate, by test-class name.
+    :param workers:     The number of worker processes, or None for one per CPU.
+    :return:            The records of each test-class's tests (as returned by
+                        regenerate_tests), or the exception its task failed with.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=initialise_worker,
+                             initargs=(list(sys.path),)) as executor:
+        tasks = {class_name: executor.submit(regenerate_tests, test_ids)
+                 for class_name, test_ids in classes.items()}
+
+        for class_name, task in tasks.items():
+            try:
+                results[class_name] = task.result()
+            except Exception as e:
+                results[class_name] = e
+
+    return results
+
+
+def initialise_worker(path: List[str]):
+    """
+    Prepares a worker process for regenerating baselines.
+
+    :param path:    The module search path of the parent process.
+    """
+    # Make sure the worker can import the same tests as the parent
+    sys.path[:] = path
+
+    # Put the regression tests into update mode
+    os.environ[UPDATE_BASELINES_ENVIRONMENT_VARIABLE] = "1"
+
+    # Orphans are reported across all tests in the summary instead
+    warnings.simplefilter("ignore", OrphanedRegressionWarning)
+
+
+def regenerate_tests(test_ids: List[str]) -> List[TestRecord]:
+    """
+    Runs the given regression tests (of a single test-class) in update mode.
+
+    :param test_ids:    The ids of the tests to run.
+    :return:            For each test, its id, the baselines it updated, the
+                        reason it failed (or None if it didn't), and whether
+                        it actually ran and passed (i.e. wasn't skipped or
+                        an expected failure), and so produced all its baselines.
+    """
+    result = RegenerationResult()
+
+    try:
+        defaultTestLoader.loadTestsFromNames(test_ids).run(result)
+    except Exception:
+        result.problems.append(traceback.format_exc())
+
+    # Tests that never ran (e.g. because the class failed to set up)
+    # fail with whatever went wrong outside of them
+    failure = "\n".join(result.problems) if len(result.problems) > 0 else "Test did not run"
+    records = result.records
+    ran = {test_id for test_id, _, _, _ in records}
+    records.extend((test_id, [], failure, False) for test_id in test_ids if test_id not in ran)
+
+    return records
+
+
+class RegenerationResult(TestResult):
+    """
+    Test result which records the baselines updated by each test, and
+    whether the test ran and passed, in a form that can be sent between
+    processes.
+    """
+    def __init__(self):
+        super().__init__()
+
+        # The (test id, baselines updated, failure, whether it ran and passed) of each test
+        self.records: List[TestRecord] = []
+
+        # The reasons for failures outside of any test (e.g. in class set-up)
+        self.problems: List[str] = []
+
+        # The reasons the current test failed
+        self.current: List[str] = []
+
+        # Whether the current test was skipped or expected to fail
+        self.not_passed: bool = False
+
+    def startTest(self, test: TestCase):
+        super().startTest(test)
+        self.current = []
+        self.not_passed = False
+
+        # Updates from outside any test don't belong to this one
+        pop_baseline_updates()
+
+    def stopTest(self, test: TestCase):
+        super().stopTest(test)
+        failure = "\n".join(self.current) if len(self.current) > 0 else None
+        passed = failure is None and not self.not_passed
+        self.records.append((test.id(), pop_baseline_updates(), failure, passed))
+
+    def addFailure(self, test: TestCase, err):
+        super().addFailure(test, err)
+        self.add_problem(test, self.failures[-1][1])
+
+    def addError(self, test: TestCase, err):
+        super().addError(test, err)
+        self.add_problem(test, self.errors[-1][1])
+
+    def addSkip(self, test: TestCase, reason: str):
+        super().addSkip(test, reason)
+        self.not_passed = True
+
+    def addExpectedFailure(self, test: TestCase, err):
+        super().addExpectedFailure(test, err)
+        self.not_passed = True
+
+    def addUnexpectedSuccess(self, test: TestCase):
+        super().addUnexpectedSuccess(test)
+        self.current.append("Unexpected success")
+
+    def addSubTest(self, test: TestCase, subtest: TestCase, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            problems = self.failures if issubclass(err[0], test.failureException) else self.errors
+            self.current.append(problems[-1][1])
+
+    def add_problem(self, test: TestCase, message: str):
+        """
+        Records the reason for a failure, against the current test if
+        it's one of the tests being run, or else as a failure outside
+        of any test.
+
+        :param test:        The test (or fixture) which failed.
+        :param message:     The formatted failure.
+        """
+        if isinstance(test, AbstractTest):
+            self.current.append(message)
+        else:
+            self.problems.append(message)
+
+
+def find_orphans(tests: List[AbstractTest],
+                 produced: Dict[str, List[str]],
+                 complete: Set[str],
+                 whole_suite: bool = True) -> List[str]:
+    """
+    Finds the baseline files which weren't produced by any test.
+
+    :param tests:       The regression tests that were regenerated.
+    :param produced:    The absolute filenames of the baselines produced by each test.
+    :param complete:    The ids of the tests that ran and passed.
+    :param whole_suite: Whether all the tests were loaded, so that baselines of
+                        unknown tests are orphaned. If not, they may belong to
+                        test-classes that weren't loaded, so only the unused
+                        baselines of the complete tests are reported.
+    :return:            The absolute filenames of the orphaned baselines.
+    """
+    # Scan each regression path once
+    manifests: Dict[str, Tuple[RegressionManifest, Type[AbstractTest]]] = {}
+    for test in tests:
+        path = os.path.abspath(test.get_regression_path())
+        if path not in manifests:
+            manifests[path] = RegressionManifest.scan(path), type(test)
+        manifest = manifests[path][0]
+
+        # Mark the baselines the test produced as used
+        for filename in produced[test.id()]:
+            manifest.exists(filename)
+
+        # Tests that were skipped, or failed part-way, may not have produced all their baselines
+        if test.id() in complete:
+            manifest.mark_complete(test.get_test_method_name())
+
+    # Collect the orphans from each path
+    orphans = []
+    for manifest, test_class in manifests.values():
+        known = test_class.get_known_regression_test_names() if whole_suite else None
+        orphans.extend(manifest.orphans(known))
+
+    return orphans
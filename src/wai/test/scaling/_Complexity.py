@@ -0,0 +1,30 @@
+import math
+from typing import Callable
+
+
+class Complexity:
+    """
+    An order of growth, used as the bound on how a subject's
+    execution time may grow with the size of its input.
+    """
+    def __init__(self, name: str, function: Callable[[float], float]):
+        # The name of the order, in terms of the size n
+        self.name: str = name
+
+        # The function giving the order's growth with size
+        self.function: Callable[[float], float] = function
+
+    def __call__(self, size: float) -> float:
+        return self.function(size)
+
+    def __str__(self) -> str:
+        return "O(" + self.name + ")"
+
+
+# The common orders of growth
+CONSTANT = Complexity("1", lambda n: 1.0)
+LOGARITHMIC = Complexity("log n", lambda n: math.log(n))
+LINEAR = Complexity("n", lambda n: n)
+LINEARITHMIC = Complexity("n log n", lambda n: n * math.log(n))
+QUADRATIC = Complexity("n^2", lambda n: n ** 2)
+CUBIC = Complexity("n^3", lambda n: n ** 3)
@@ -0,0 +1,10 @@
+class ScalingResult:
+    """
+    The result of a scaling test, stored as a regression baseline.
+    """
+    def __init__(self, exponent: float, tolerance: float = 0.0):
+        # The fitted exponent of the growth of execution time with size
+        self.exponent: float = exponent
+
+        # How far the exponent may exceed the baseline's before failing
+        self.tolerance: float = tolerance
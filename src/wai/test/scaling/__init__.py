@@ -0,0 +1,3 @@
+from ._Complexity import Complexity, CONSTANT, LOGARITHMIC, LINEAR, LINEARITHMIC, QUADRATIC, CUBIC
+from ._functions import geometric_sizes, fit_exponent
+from ._ScalingResult import ScalingResult
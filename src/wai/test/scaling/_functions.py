@@ -0,0 +1,54 @@
+"""
+Module for helper functions for scaling tests.
+"""
+import math
+from typing import List
+
+
+def geometric_sizes(minimum: int, maximum: int, factor: float = 2) -> List[int]:
+    """
+    Creates a geometric range of input sizes.
+
+    :param minimum:     The smallest size.
+    :param maximum:     The largest size (inclusive).
+    :param factor:      The ratio between consecutive sizes.
+    :return:            The distinct sizes, in increasing order.
+    """
+    # The range would never end
+    if minimum <= 0 or factor <= 1:
+        raise ValueError("Geometric range needs a positive minimum and a factor greater than 1, got " +
+                         "minimum=" + str(minimum) + ", factor=" + str(factor))
+
+    sizes = []
+    size = minimum
+    while size <= maximum:
+        # Truncating may repeat a size when the factor is close to 1
+        if len(sizes) == 0 or int(size) != sizes[-1]:
+            sizes.append(int(size))
+        size *= factor
+
+    return sizes
+
+
+def fit_exponent(sizes: List[int], times: List[float]) -> float:
+    """
+    Fits the exponent k of the growth t ~ n^k of execution time with
+    input size, by least-squares in log-log space.
+
+    :param sizes:   The input sizes.
+    :param times:   The execution time at each size.
+    :return:        The fitted exponent.
+    """
+    if len(sizes) < 2:
+        raise ValueError("Need at least 2 sizes to fit an exponent, got " + str(len(sizes)))
+
+    # Guard against times below the timer's resolution
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(time, 1e-9)) for time in times]
+
+    # The slope of the least-squares line
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / \
+        sum((x - mean_x) ** 2 for x in xs)
@@ -0,0 +1,193 @@
+import mmap
+import pickle
+import struct
+from typing import IO, Any, List, Optional, Tuple
+
+from ._RegressionSerialiser import RegressionSerialiser
+
+# Marks the start of a pickle regression file
+MAGIC: bytes = b"WAIPKL5\x00"
+
+# Format of the header fields (little-endian unsigned 64-bit integers)
+FIELD_FORMAT: str = "<Q"
+FIELD_SIZE: int = struct.calcsize(FIELD_FORMAT)
+
+# Alignment of segments within the file, so that buffers mapped from
+# disk satisfy the alignment requirements of most array libraries
+ALIGNMENT: int = 64
+
+
+class PickleSerialiser(RegressionSerialiser[Any]):
+    """
+    General serialiser which saves any picklable result in a .pkl file,
+    using pickle protocol 5. Large contiguous buffers exposed by the result
+    (e.g. the data of numpy arrays) are written out-of-band into their own
+    aligned segments of the file, and are memory-mapped directly from disk
+    on load rather than copied.
+
+    File layout:
+        - the magic bytes
+        - the number of segments
+        - the (offset, length) of each segment
+        - the segments themselves, each aligned to ALIGNMENT bytes
+
+    The first segment is the in-band pickle stream, the remainder are the
+    out-of-band buffers in the order pickle produced them.
+    """
+    @classmethod
+    def binary(cls) -> bool:
+        return True
+
+    @classmethod
+    def extension(cls) -> str:
+        return "pkl"
+
+    @classmethod
+    def serialise(cls, result: Any, file: IO[bytes]):
+        # Pickle the result, keeping the large buffers out-of-band
+        stream, buffers = cls.pickle(result)
+        segments = [memoryview(stream), *buffers]
+
+        # Work out where each segment will sit in the file
+        header_size = len(MAGIC) + FIELD_SIZE * (1 + 2 * len(segments))
+        layout = []
+        offset = header_size
+        for segment in segments:
+            offset = aligned(offset)
+            layout.append((offset, segment.nbytes))
+            offset += segment.nbytes
+
+        # Write the header
+        file.write(MAGIC)
+        file.write(struct.pack(FIELD_FORMAT, len(segments)))
+        for offset, length in layout:
+            file.write(struct.pack(FIELD_FORMAT, offset))
+            file.write(struct.pack(FIELD_FORMAT, length))
+
+        # Write the segments, padding each to its aligned offset
+        position = header_size
+        for (offset, length), segment in zip(layout, segments):
+            file.write(bytes(offset - position))
+            file.write(segment)
+            position = offset + length
+
+    @classmethod
+    def deserialise(cls, file: IO[bytes]) -> Any:
+        # Map the file into memory (the mapping outlives the file handle,
+        # and is kept alive by the buffers that reference it). The mapping
+        # is copy-on-write, so the buffers are writable like the originals
+        # (and so re-pickle identically) without being copied
+        mapped = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+
+        # Check this is a pickle regression file
+        if mapped[:len(MAGIC)] != MAGIC:
+            raise ValueError("File is not a pickle regression file: " + file.name)
+
+        # Read the segment layout from the header
+        position = len(MAGIC)
+        fields = []
+        count = read_field(mapped, position)
+        for index in range(2 * count):
+            position += FIELD_SIZE
+            fields.append(read_field(mapped, position))
+
+        # Slice the segments out of the mapping without copying
+        segments = [mapped[offset:offset + length]
+                    for offset, length in zip(fields[::2], fields[1::2])]
+
+        return pickle.loads(segments[0], buffers=segments[1:])
+
+    @classmethod
+    def compare(cls, result: Any, reference: Any) -> Optional[str]:
+        # If the pickled forms are identical (buffer-by-buffer), the results are equal
+        result_stream, result_buffers = cls.pickle(result)
+        reference_stream, reference_buffers = cls.pickle(reference)
+        if result_stream == reference_stream and \
+                len(result_buffers) == len(reference_buffers) and \
+                all(result_buffer == reference_buffer
+                    for result_buffer, reference_buffer in zip(result_buffers, reference_buffers)):
+            return None
+
+        # Otherwise the pickled forms may legitimately differ (e.g. set ordering, or
+        # arrays pickled in-band when strided but out-of-band once loaded contiguously),
+        # so compare the values themselves
+        return "result does not equal reference" if not values_equal(result, reference) else None
+
+    @classmethod
+    def pickle(cls, result: Any) -> Tuple[bytes, List[memoryview]]:
+        """
+        Pickles the given result with protocol 5.
+
+        :param result:  The result to pickle.
+        :return:        The in-band pickle stream, and the raw (byte-format)
+                        views of the out-of-band buffers.
+        """
+        buffers = []
+        stream = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+
+        return stream, [buffer.raw() for buffer in buffers]
+
+
+def values_equal(result: Any, reference: Any) -> bool:
+    """
+    Compares two values for equality without relying on == returning a
+    bool, so that array-like values (whose == is element-wise) are
+    compared correctly.
+
+    :param result:      The result value.
+    :param reference:   The reference value.
+    :return:            True if the values are equal,
+                        False if not.
+    """
+    if type(result) is not type(reference):
+        return False
+
+    # Compare containers element-by-element
+    if isinstance(result, dict):
+        return result.keys() == reference.keys() and \
+            all(values_equal(value, reference[key]) for key, value in result.items())
+    if isinstance(result, (list, tuple)):
+        return len(result) == len(reference) and \
+            all(values_equal(item, reference_item) for item, reference_item in zip(result, reference))
+
+    # Compare values exposing a buffer by their logical contents (format, shape
+    # and element bytes in order, regardless of memory layout)
+    try:
+        result_view, reference_view = memoryview(result), memoryview(reference)
+    except (TypeError, ValueError):
+        pass
+    else:
+        return result_view.format == reference_view.format and \
+            result_view.shape == reference_view.shape and \
+            result_view.tobytes() == reference_view.tobytes()
+
+    # Compare the attributes of objects without their own notion of equality
+    if type(result).__eq__ is object.__eq__ and hasattr(result, "__dict__"):
+        return values_equal(vars(result), vars(reference))
+
+    # Otherwise use standard equality, as long as it gives a truth value
+    try:
+        return bool(result == reference)
+    except Exception:
+        return False
+
+
+def aligned(offset: int) -> int:
+    """
+    Rounds the given offset up to the next multiple of ALIGNMENT.
+
+    :param offset:  The offset to align.
+    :return:        The aligned offset.
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def read_field(data: memoryview, position: int) -> int:
+    """
+    Reads a single header field from the given data.
+
+    :param data:        The data to read from.
+    :param position:    The position of the field in the data.
+    :return:            The value of the field.
+    """
+    return struct.unpack_from(FIELD_FORMAT, data, position)[0]
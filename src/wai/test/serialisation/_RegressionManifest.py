@@ -0,0 +1,133 @@
+import os
+from typing import Set, List, Iterable, Optional
+
+
+class RegressionManifest:
+    """
+    Index of the regression files stored under a directory. Built with
+    a single scan of the directory, after which checking for, loading
+    and saving regression files doesn't need to probe the filesystem.
+    Also tracks which files have been used, so that files no test
+    produces any more can be reported.
+
+    All filenames are handled in absolute form.
+    """
+    def __init__(self, path: str, filenames: Iterable[str] = (), directories: Iterable[str] = ()):
+        # The directory the manifest indexes
+        self.path: str = os.path.abspath(path)
+
+        # The regression files under the directory
+        self._filenames: Set[str] = set(os.path.abspath(filename) for filename in filenames)
+
+        # The directories known to exist
+        self._directories: Set[str] = set(os.path.abspath(directory) for directory in directories)
+
+        # The regression files which have been checked for or saved
+        self._used: Set[str] = set()
+
+        # The names of the tests which have handled all of their results
+        self._complete: Set[str] = set()
+
+    @classmethod
+    def scan(cls, path: str) -> 'RegressionManifest':
+        """
+        Creates a manifest by scanning the given directory.
+
+        :param path:    The directory to scan.
+        :return:        The manifest of the directory.
+        """
+        filenames = []
+        directories = []
+        for root, _, files in os.walk(path):
+            directories.append(root)
+            filenames.extend(os.path.join(root, filename) for filename in files)
+
+        return RegressionManifest(path, filenames, directories)
+
+    def exists(self, filename: str) -> bool:
+        """
+        Whether the given regression file exists. Marks the
+        file as used.
+
+        :param filename:    The filename to look for.
+        :return:            True if the file exists,
+                            False if not.
+        """
+        filename = os.path.abspath(filename)
+
+        if filename not in self._filenames:
+            return False
+
+        self._used.add(filename)
+
+        return True
+
+    def add(self, filename: str):
+        """
+        Adds a newly-saved regression file to the manifest. Marks
+        the file as used.
+
+        :param filename:    The filename of the saved file.
+        """
+        filename = os.path.abspath(filename)
+
+        self._filenames.add(filename)
+        self._used.add(filename)
+        self.add_directory(os.path.dirname(filename))
+
+    def has_directory(self, directory: str) -> bool:
+        """
+        Whether the given directory is known to exist.
+
+        :param directory:   The directory to look for.
+        :return:            True if the directory exists,
+                            False if not.
+        """
+        return os.path.abspath(directory) in self._directories
+
+    def add_directory(self, directory: str):
+        """
+        Adds a newly-created directory (and its parents) to the manifest.
+
+        :param directory:   The created directory.
+        """
+        directory = os.path.abspath(directory)
+
+        while directory not in self._directories:
+            self._directories.add(directory)
+
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+
+    def mark_complete(self, test_name: str):
+        """
+        Marks that the named regression test has handled all of its
+        results, so any of its files not used are orphaned.
+
+        :param test_name:   The name of the regression test.
+        """
+        self._complete.add(test_name)
+
+    def orphans(self, test_names: Optional[Set[str]] = None) -> List[str]:
+        """
+        Gets the regression files which no test produced. These are the
+        unused files of complete tests and, if all the tests storing
+        results under this manifest's directory are known, the files of
+        tests that no longer exist.
+
+        :param test_names:  The names of all the regression tests which store
+                            their results under this manifest's directory, or
+                            None to only check the complete tests.
+        :return:            The orphaned filenames.
+        """
+        orphans = []
+        for filename in self._filenames - self._used:
+            # Get the name of the test that the file belongs to
+            test_name = os.path.relpath(filename, self.path).split(os.sep)[0]
+
+            if test_name in self._complete or (test_names is not None and test_name not in test_names):
+                orphans.append(filename)
+
+        return sorted(orphans)
@@ -2,6 +2,8 @@ import os
 from abc import abstractmethod
 from typing import IO, Generic, TypeVar, AnyStr, Optional
 
+from ._RegressionManifest import RegressionManifest
+
 # The types of the regression result and the disk type
 ResultType = TypeVar("ResultType")
 
@@ -49,31 +51,46 @@ class RegressionSerialiser(Generic[ResultType]):
         return filename
 
     @classmethod
-    def exists(cls, filename: str) -> bool:
+    def exists(cls, filename: str, manifest: Optional[RegressionManifest] = None) -> bool:
         """
         Whether a regression file exists under the given filename.
 
         :param filename:    The filename to look for.
+        :param manifest:    The manifest of existing regression files,
+                            or None to check the filesystem directly.
         :return:            True if the given regression file exists,
                             False if not.
         """
-        return os.path.exists(cls.extend(filename))
+        # Add the extension to the filename
+        filename = cls.extend(filename)
+
+        # Use the manifest if we have one
+        if manifest is not None:
+            return manifest.exists(filename)
+
+        return os.path.exists(filename)
 
     @classmethod
-    def save(cls, result: ResultType, filename: str):
+    def save(cls, result: ResultType, filename: str, manifest: Optional[RegressionManifest] = None):
         """
         Saves the given result to the given file.
 
         :param result:      The result to save.
         :param filename:    The name of the file to save to.
+        :param manifest:    The manifest of existing regression files to
+                            add the file to, or None if not using one.
         """
         # Add the extension to the filename
         filename = cls.extend(filename)
 
         # If the path to the file doesn't exist, create it
         path = os.path.dirname(filename)
-        if not os.path.exists(path):
+        if manifest is None:
+            if not os.path.exists(path):
+                os.makedirs(path, exist_ok=True)
+        elif not manifest.has_directory(path):
             os.makedirs(path, exist_ok=True)
+            manifest.add_directory(path)
 
         # Determine if we need to open in binary or text mode
         mode = "w" if not cls.binary() else "wb"
@@ -82,6 +99,10 @@ class RegressionSerialiser(Generic[ResultType]):
         with open(filename, mode) as file:
             cls.serialise(result, file)
 
+        # Keep the manifest up-to-date
+        if manifest is not None:
+            manifest.add(filename)
+
     @classmethod
     @abstractmethod
     def serialise(cls, result: ResultType, file: IO[AnyStr]):
@@ -94,16 +115,22 @@ class RegressionSerialiser(Generic[ResultType]):
         pass
 
     @classmethod
-    def load(cls, filename: str) -> ResultType:
+    def load(cls, filename: str, manifest: Optional[RegressionManifest] = None) -> ResultType:
         """
         Loads the regression result from the given file.
 
         :param filename:    The file to load from.
+        :param manifest:    The manifest of existing regression files,
+                            or None if not using one.
         :return:            The result stored in the file.
         """
         # Add the extension to the filename
         filename = cls.extend(filename)
 
+        # Fail early if the manifest knows the file doesn't exist
+        if manifest is not None and not manifest.exists(filename):
+            raise FileNotFoundError("No regression file: " + filename)
+
         # Determine if we need to open in binary or text mode
         mode = "r" if not cls.binary() else "rb"
 
@@ -135,3 +162,19 @@ class RegressionSerialiser(Generic[ResultType]):
                             or None if it passed.
         """
         return "result does not equal reference" if result != reference else None
+
+    @classmethod
+    def changed(cls, result: ResultType, reference: ResultType) -> bool:
+        """
+        Whether the result differs from the reference enough that the
+        baseline should be rewritten when updating baselines. Defaults to
+        the result failing the comparison, but can be overridden where
+        the comparison is one-sided (e.g. only failing on regressions,
+        so that improvements would otherwise never be recorded).
+
+        :param result:      The result of this regression test.
+        :param reference:   The reference result from disk.
+        :return:            True if the baseline should be rewritten,
+                            False if not.
+        """
+        return cls.compare(result, reference) is not None
@@ -0,0 +1,40 @@
+from typing import IO, Optional
+
+from ._RegressionSerialiser import RegressionSerialiser
+from ..scaling import ScalingResult
+
+
+class ScalingSerialiser(RegressionSerialiser[ScalingResult]):
+    """
+    Serialiser which saves the fitted exponent of a scaling test in a
+    .scaling file. A result passes if its exponent doesn't exceed the
+    reference's by more than the result's tolerance. When updating
+    baselines, the reference is rewritten if the exponent has moved by
+    more than the tolerance in either direction.
+    """
+    @classmethod
+    def binary(cls) -> bool:
+        return False
+
+    @classmethod
+    def extension(cls) -> str:
+        return "scaling"
+
+    @classmethod
+    def serialise(cls, result: ScalingResult, file: IO[str]):
+        file.write(repr(result.exponent) + "\n")
+
+    @classmethod
+    def deserialise(cls, file: IO[str]) -> ScalingResult:
+        return ScalingResult(float(file.read()))
+
+    @classmethod
+    def compare(cls, result: ScalingResult, reference: ScalingResult) -> Optional[str]:
+        if result.exponent > reference.exponent + result.tolerance:
+            return "scaling exponent " + format(result.exponent, ".3f") + \
+                   " exceeds reference " + format(reference.exponent, ".3f") + \
+                   " by more than " + format(result.tolerance, ".3f")
+
+    @classmethod
+    def changed(cls, result: ScalingResult, reference: ScalingResult) -> bool:
+        return abs(result.exponent - reference.exponent) > result.tolerance
@@ -1,3 +1,6 @@
 from ._BytesSerialiser import BytesSerialiser
+from ._PickleSerialiser import PickleSerialiser
+from ._RegressionManifest import RegressionManifest
 from ._RegressionSerialiser import RegressionSerialiser
+from ._ScalingSerialiser import ScalingSerialiser
 from ._StringSerialiser import StringSerialiser
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+
+from wai.test import AbstractTest
+from wai.test.serialisation import PickleSerialiser
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class PickleSerialiserTest(unittest.TestCase):
+    """
+    Tests that results compare equal to their own saved baselines.
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def round_trip(self, result):
+        """
+        Saves the result and loads it back.
+
+        :param result:  The result to save.
+        :return:        The loaded reference.
+        """
+        filename = os.path.join(self.directory.name, "result")
+        PickleSerialiser.save(result, filename)
+
+        return PickleSerialiser.load(filename)
+
+    def assertRoundTrips(self, result):
+        self.assertIsNone(PickleSerialiser.compare(result, self.round_trip(result)))
+
+    def test_plain_objects(self):
+        self.assertRoundTrips({"a": [1, 2.5, "x"], "b": {1, 2, "three"}, "c": b"bytes"})
+
+    def test_plain_objects_differ(self):
+        reference = self.round_trip({"a": [1, 2]})
+        self.assertIsNotNone(PickleSerialiser.compare({"a": [1, 3]}, reference))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_contiguous_array(self):
+        self.assertRoundTrips(numpy.arange(100.0))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_strided_array(self):
+        self.assertRoundTrips(numpy.arange(100.0)[::2])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_fortran_array(self):
+        self.assertRoundTrips(numpy.asfortranarray(numpy.arange(12.0).reshape(3, 4)))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_transposed_array(self):
+        self.assertRoundTrips(numpy.arange(12.0).reshape(3, 4).T)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_arrays_in_dict(self):
+        self.assertRoundTrips({"contiguous": numpy.ones(10),
+                               "strided": numpy.arange(20)[::3],
+                               "fortran": numpy.asfortranarray(numpy.ones((2, 3))),
+                               "x": 1})
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_loaded_array_is_writable(self):
+        self.assertTrue(self.round_trip(numpy.arange(10.0)).flags.writeable)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_arrays_differ(self):
+        reference = self.round_trip({"arr": numpy.arange(10.0)})
+        self.assertIsNotNone(PickleSerialiser.compare({"arr": numpy.arange(10.0) + 1}, reference))
+        self.assertIsNotNone(PickleSerialiser.compare({"arr": numpy.arange(10.0)[::-1]}, reference))
+        self.assertIsNotNone(PickleSerialiser.compare({"arr": numpy.arange(10.0).reshape(2, 5)}, reference))
+
+    @unittest.skipIf(numpy is None or not os.path.exists("/proc/self/maps"), "requires numpy and /proc")
+    def test_update_releases_reference_before_saving(self):
+        directory = self.directory.name
+
+        class UpdateTest(AbstractTest):
+            @classmethod
+            def subject_type(cls):
+                return list
+
+            @classmethod
+            def get_regression_root_path(cls):
+                return directory
+
+        filename = os.path.join(UpdateTest.get_regression_path(), "test", "result")
+        PickleSerialiser.save(numpy.arange(1000.0), filename)
+
+        # Record whether the old file is still mapped when it's overwritten
+        mapped = []
+
+        class CheckingSerialiser(PickleSerialiser):
+            @classmethod
+            def save(cls, result, filename, manifest=None):
+                with open("/proc/self/maps") as maps:
+                    mapped.append(any(cls.extend(filename) in line for line in maps))
+                super().save(result, filename, manifest)
+
+        UpdateTest.update_regression_baseline(CheckingSerialiser, numpy.arange(2000.0), filename)
+
+        self.assertEqual(mapped, [False])
+        self.assertIsNone(PickleSerialiser.compare(numpy.arange(2000.0), PickleSerialiser.load(filename)))
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from wai.test.serialisation import RegressionManifest
+
+
+class RegressionManifestTest(unittest.TestCase):
+    """
+    Tests indexing regression files and finding those no test produced.
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+        # Two tests with two results each
+        for test_name in ("a", "b"):
+            os.makedirs(self.path(test_name))
+            for result_name in ("r1.txt", "r2.txt"):
+                open(self.path(test_name, result_name), "w").close()
+
+        self.manifest = RegressionManifest.scan(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def path(self, *parts: str) -> str:
+        """
+        Gets the absolute path to a file or directory in the regression directory.
+
+        :param parts:   The parts of the path, relative to the regression directory.
+        :return:        The absolute path.
+        """
+        return os.path.abspath(os.path.join(self.directory.name, *parts))
+
+    def test_scan(self):
+        self.assertTrue(self.manifest.exists(self.path("a", "r1.txt")))
+        self.assertFalse(self.manifest.exists(self.path("a", "r3.txt")))
+        self.assertTrue(self.manifest.has_directory(self.path("b")))
+        self.assertFalse(self.manifest.has_directory(self.path("c")))
+
+    def test_add(self):
+        self.manifest.add(self.path("c", "d", "r1.txt"))
+        self.assertTrue(self.manifest.exists(self.path("c", "d", "r1.txt")))
+        self.assertTrue(self.manifest.has_directory(self.path("c", "d")))
+        self.assertTrue(self.manifest.has_directory(self.path("c")))
+
+    def test_no_orphans_until_complete(self):
+        self.manifest.exists(self.path("a", "r1.txt"))
+        self.assertEqual(self.manifest.orphans(), [])
+
+    def test_unused_files_of_complete_tests(self):
+        self.manifest.exists(self.path("a", "r1.txt"))
+        self.manifest.mark_complete("a")
+        self.assertEqual(self.manifest.orphans(), [self.path("a", "r2.txt")])
+
+    def test_added_files_are_used(self):
+        self.manifest.add(self.path("a", "r3.txt"))
+        self.manifest.mark_complete("a")
+        self.assertEqual(self.manifest.orphans(), [self.path("a", "r1.txt"), self.path("a", "r2.txt")])
+
+    def test_files_of_unknown_tests(self):
+        for result_name in ("r1.txt", "r2.txt"):
+            self.manifest.exists(self.path("a", result_name))
+        self.manifest.mark_complete("a")
+        self.assertEqual(self.manifest.orphans({"a"}), [self.path("b", "r1.txt"), self.path("b", "r2.txt")])
+        self.assertEqual(self.manifest.orphans({"a", "b"}), [])
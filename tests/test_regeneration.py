@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+from wai.test import AbstractTest
+from wai.test.decorators import RegressionTest, Skip
+from wai.test.regeneration import RegenerationSummary
+from wai.test.regeneration._regenerate import find_orphans, RegenerationResult
+from wai.test._constants import UPDATE_BASELINES_ENVIRONMENT_VARIABLE
+from wai.test._baselines import BASELINE_NEW
+
+
+class Subject:
+    """
+    Subject of the regression tests being regenerated.
+    """
+    def __str__(self) -> str:
+        return "subject"
+
+
+def create_test_class(directory: str):
+    """
+    Creates a test-class storing its regression results in the given
+    directory (created per test, so unittest doesn't collect it).
+
+    :param directory:   The root directory of the regression results.
+    :return:            The test-class.
+    """
+    class SubjectTest(AbstractTest):
+        @classmethod
+        def subject_type(cls):
+            return Subject
+
+        @classmethod
+        def get_regression_root_path(cls):
+            return directory
+
+        @RegressionTest
+        def passes(self, subject):
+            return {"r": str(subject)}
+
+        @RegressionTest
+        @Skip("skipped")
+        def skipped(self, subject):
+            return {"r": str(subject)}
+
+        @RegressionTest
+        def fails(self, subject):
+            self.fail("failed")
+
+    return SubjectTest
+
+
+class FindOrphansTest(unittest.TestCase):
+    """
+    Tests finding the baselines which no regenerated test produced.
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        test_class = create_test_class(self.directory.name)
+        self.tests = [test_class("passes"), test_class("skipped"), test_class("fails")]
+
+        # A baseline for each test, a stale one, and one of a test which no longer exists
+        self.path = os.path.abspath(test_class.get_regression_path())
+        for test_name in ("passes", "skipped", "fails", "gone"):
+            os.makedirs(os.path.join(self.path, test_name))
+            open(self.baseline(test_name), "w").close()
+        open(self.baseline("passes", "stale.txt"), "w").close()
+
+        self.produced = {test.id(): [] for test in self.tests}
+        self.produced[self.tests[0].id()].append(self.baseline("passes"))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def baseline(self, test_name: str, filename: str = "r.txt") -> str:
+        """
+        Gets the absolute filename of a baseline of one of the tests.
+
+        :param test_name:   The name of the test.
+        :param filename:    The name of the baseline file.
+        :return:            The absolute filename.
+        """
+        return os.path.join(self.path, test_name, filename)
+
+    def test_whole_suite(self):
+        orphans = find_orphans(self.tests, self.produced, {self.tests[0].id()}, True)
+        self.assertEqual(orphans, [self.baseline("gone"), self.baseline("passes", "stale.txt")])
+
+    def test_part_of_suite(self):
+        orphans = find_orphans(self.tests, self.produced, {self.tests[0].id()}, False)
+        self.assertEqual(orphans, [self.baseline("passes", "stale.txt")])
+
+    def test_incomplete_tests_keep_their_baselines(self):
+        orphans = find_orphans(self.tests, self.produced, set(), False)
+        self.assertEqual(orphans, [])
+
+
+class RegenerationResultTest(unittest.TestCase):
+    """
+    Tests recording the baselines each test updated, and whether it passed.
+    """
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_records(self):
+        test_class = create_test_class(self.directory.name)
+        result = RegenerationResult()
+
+        with mock.patch.dict(os.environ, {UPDATE_BASELINES_ENVIRONMENT_VARIABLE: "1"}), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            unittest.TestSuite([test_class("passes"), test_class("skipped"), test_class("fails")]).run(result)
+
+        passes, skipped, fails = result.records
+        self.assertEqual(passes[1], [(os.path.join(test_class.get_regression_path(), "passes", "r.txt"), BASELINE_NEW)])
+        self.assertEqual((passes[2], passes[3]), (None, True))
+        self.assertEqual(skipped[1:], ([], None, False))
+        self.assertIn("failed", fails[2])
+        self.assertFalse(fails[3])
+        self.assertEqual(result.problems, [])
+
+    def test_class_set_up_failure(self):
+        class FailingTest(create_test_class(self.directory.name)):
+            @classmethod
+            def setUpClass(cls):
+                raise RuntimeError("set-up failed")
+
+        result = RegenerationResult()
+        unittest.TestSuite([FailingTest("passes")]).run(result)
+
+        self.assertEqual(result.records, [])
+        self.assertEqual(len(result.problems), 1)
+        self.assertIn("set-up failed", result.problems[0])
+
+
+class RegenerationSummaryTest(unittest.TestCase):
+    """
+    Tests formatting the summary of a regeneration.
+    """
+    def test_format(self):
+        summary = RegenerationSummary()
+        summary.new = ["b.txt", "a.txt"]
+        summary.unchanged = ["c.txt"]
+        summary.orphaned = ["d.txt"]
+        summary.failed = {"module.Test.test": "Traceback\nError"}
+
+        self.assertEqual(summary.format(),
+                         "New (2):\n"
+                         "    a.txt\n"
+                         "    b.txt\n"
+                         "Orphaned (1):\n"
+                         "    d.txt\n"
+                         "Failed (1):\n"
+                         "    module.Test.test\n"
+                         "        Traceback\n"
+                         "        Error\n"
+                         "2 new, 0 changed, 1 unchanged, 1 orphaned, 1 failed\n")
+
+    def test_format_empty(self):
+        self.assertEqual(RegenerationSummary().format(), "0 new, 0 changed, 0 unchanged, 0 orphaned, 0 failed\n")
@@ -0,0 +1,84 @@
+import unittest
+
+from wai.test.decorators import ScalingTest
+from wai.test.scaling import geometric_sizes, fit_exponent, ScalingResult, LINEAR, LOGARITHMIC
+from wai.test.serialisation import ScalingSerialiser
+
+
+class GeometricSizesTest(unittest.TestCase):
+    """
+    Tests the geometric ranges of input sizes.
+    """
+    def test_doubling(self):
+        self.assertEqual(geometric_sizes(128, 1024, 2), [128, 256, 512, 1024])
+
+    def test_maximum_not_on_range(self):
+        self.assertEqual(geometric_sizes(10, 100, 3), [10, 30, 90])
+
+    def test_truncated_sizes_are_distinct(self):
+        sizes = geometric_sizes(2, 64, 1.1)
+        self.assertEqual(sizes, sorted(set(sizes)))
+        self.assertEqual(sizes[0], 2)
+        self.assertLessEqual(sizes[-1], 64)
+
+    def test_endless_ranges_rejected(self):
+        for minimum, factor in ((128, 1), (128, 0.5), (0, 2), (-1, 2)):
+            with self.subTest(minimum=minimum, factor=factor):
+                with self.assertRaises(ValueError):
+                    geometric_sizes(minimum, 8192, factor)
+
+
+class FitExponentTest(unittest.TestCase):
+    """
+    Tests fitting the exponent of the growth of execution time.
+    """
+    def test_exact_powers(self):
+        sizes = [10, 20, 40, 80]
+        for exponent in (0, 1, 2, 3):
+            with self.subTest(exponent=exponent):
+                self.assertAlmostEqual(fit_exponent(sizes, [1e-6 * size ** exponent for size in sizes]), exponent)
+
+    def test_times_below_resolution(self):
+        self.assertAlmostEqual(fit_exponent([10, 100], [0.0, 0.0]), 0.0)
+
+    def test_needs_two_sizes(self):
+        with self.assertRaises(ValueError):
+            fit_exponent([10], [1.0])
+
+
+class ScalingTestArgumentsTest(unittest.TestCase):
+    """
+    Tests the arguments to the @ScalingTest decorator are checked
+    when the decorator is created.
+    """
+    def test_valid(self):
+        ScalingTest(LOGARITHMIC, min_size=2, max_size=4, factor=2)
+
+    def test_invalid(self):
+        for arguments in (dict(factor=1),
+                          dict(factor=0.5),
+                          dict(min_size=0),
+                          dict(min_size=1),
+                          dict(min_size=100, max_size=100),
+                          dict(min_size=100, max_size=150, factor=2)):
+            with self.subTest(**arguments):
+                with self.assertRaises(ValueError):
+                    ScalingTest(LINEAR, **arguments)
+
+
+class ScalingSerialiserTest(unittest.TestCase):
+    """
+    Tests comparing scaling results to their references.
+    """
+    def test_compare_only_fails_on_growth(self):
+        reference = ScalingResult(1.0)
+        self.assertIsNone(ScalingSerialiser.compare(ScalingResult(1.2, 0.25), reference))
+        self.assertIsNone(ScalingSerialiser.compare(ScalingResult(0.5, 0.25), reference))
+        self.assertIsNotNone(ScalingSerialiser.compare(ScalingResult(1.3, 0.25), reference))
+
+    def test_changed_in_either_direction(self):
+        reference = ScalingResult(1.0)
+        self.assertFalse(ScalingSerialiser.changed(ScalingResult(1.2, 0.25), reference))
+        self.assertFalse(ScalingSerialiser.changed(ScalingResult(0.8, 0.25), reference))
+        self.assertTrue(ScalingSerialiser.changed(ScalingResult(1.3, 0.25), reference))
+        self.assertTrue(ScalingSerialiser.changed(ScalingResult(0.5, 0.25), reference))